@@ -3,43 +3,196 @@
 Workout Snacks - A progressive exercise notification app
 """
 
+import heapq
+import random
 import sqlite3
+import subprocess
+import threading
+from array import array
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from functools import cached_property
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
-from typing import List, Tuple
-
-try:
-    from collections import Counter, defaultdict
-
-    import matplotlib.dates as mdates
-    import matplotlib.pyplot as plt
-    import pystray
-    from apscheduler.schedulers.background import BackgroundScheduler
-    from apscheduler.triggers.interval import IntervalTrigger
-    from PIL import Image, ImageDraw
-    from plyer import notification
-    from pystray import Menu, MenuItem
-except ImportError as e:
-    print(f"Missing dependency: {e}")
-    print("Run: pip install plyer pystray pillow apscheduler matplotlib")
+from typing import Dict, List, Optional, Set, Tuple
+
+_INSTALL_HINT = "Run: pip install plyer pystray pillow apscheduler matplotlib numpy"
+
+# Heavy dependencies are imported on first use by the _lazy_* loaders below
+np = None
+Figure = None
+
+
+def _missing_dependency(error: ImportError):
+    """Print install instructions for a missing dependency and exit"""
+    print(f"Missing dependency: {error}")
+    print(_INSTALL_HINT)
     exit(1)
 
 
+def _lazy_numpy():
+    """Import numpy into the module namespace"""
+    global np
+    if np is None:
+        try:
+            import numpy as np
+        except ImportError as e:
+            _missing_dependency(e)
+
+
+def _lazy_figure():
+    """Import numpy and matplotlib's Figure into the module namespace"""
+    global Figure
+    _lazy_numpy()
+    if Figure is None:
+        try:
+            # Charts are rendered to a PNG off the tray thread and never
+            # shown, so pyplot's global figure manager is not needed
+            from matplotlib.figure import Figure
+        except ImportError as e:
+            _missing_dependency(e)
+
+
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+WORKOUT_INTERVAL_MINUTES = 90
+
+# Trend lines longer than this are downsampled to _TREND_POINTS before plotting
+_MAX_TREND_POINTS = 2000
+_TREND_POINTS = 800
+
+# Statements executed on every save; kept as constants so sqlite3's
+# statement cache always hits
+_SQL_INSERT_SESSION = """
+    INSERT INTO workout_sessions (timestamp, ts_int, duration_minutes)
+    VALUES (?, ?, ?)
+"""
+_SQL_INSERT_EXERCISE = """
+    INSERT INTO workout_exercises (session_id, exercise_name, reps_completed)
+    VALUES (?, ?, ?)
+"""
+# One row per session exercise; {where} optionally narrows the sessions
+_SQL_LOAD_SESSIONS = """
+    SELECT ws.id, ws.ts_int, ws.duration_minutes, we.exercise_name, we.reps_completed
+    FROM workout_sessions ws
+    JOIN workout_exercises we ON ws.id = we.session_id
+    {where}
+    ORDER BY ws.ts_int, ws.id
+"""
+_SQL_UPDATE_EXERCISE = """
+    UPDATE exercises
+    SET max_reps_achieved = ?
+    WHERE category = ? AND name = ?
+"""
+
+
 @dataclass
 class Exercise:
     name: str
     difficulty_level: int
     max_reps_achieved: int = 0
     description: str = ""
+    category: str = ""
 
 
 @dataclass
 class WorkoutSession:
     timestamp: datetime
-    exercises: List[Tuple[str, int]]  # (exercise_name, reps_completed)
+    names: List[str]  # exercise names, parallel to reps
+    reps: array  # array("i") of reps completed
     duration_minutes: int = 3
 
+    @property
+    def exercises(self) -> List[Tuple[str, int]]:
+        """(exercise_name, reps_completed) pairs"""
+        return list(zip(self.names, self.reps))
+
+
+@dataclass
+class HistoryAggregates:
+    first_date: Optional[date] = None
+    last_date: Optional[date] = None
+    busiest_date: Optional[date] = None
+    busiest_count: int = 0
+
+
+@dataclass
+class HistoryArrays:
+    unique_names: "np.ndarray"  # distinct exercise names, sorted
+    name_ids: "np.ndarray"  # per rep: index into unique_names
+    first_seen: "np.ndarray"  # per name: index of its first rep in history order
+    reps: "np.ndarray"  # per rep: reps completed
+    rep_days: "np.ndarray"  # per rep: session day, as days since the epoch
+    days: "np.ndarray"  # per session: day, as days since the epoch
+
+
+def group_by(ids: "np.ndarray", n_ids: int, *columns: "np.ndarray") -> tuple:
+    """Bucket parallel columns by id; id i owns offsets[i]:offsets[i + 1]
+
+    Returns (offsets, *columns), each column reordered into its buckets.
+    """
+    _lazy_numpy()
+    # A stable sort on small integer keys is a radix sort and keeps each
+    # bucket in history order
+    order = np.argsort(ids, kind="stable")
+    offsets = np.zeros(n_ids + 1, dtype=np.intp)
+    np.cumsum(np.bincount(ids, minlength=n_ids), out=offsets[1:])
+    return (offsets, *(column[order] for column in columns))
+
+
+def rank_by_frequency(counts: "np.ndarray", first_seen: "np.ndarray") -> "np.ndarray":
+    """Ids by descending count; ties go to the one seen first, as in Counter"""
+    _lazy_numpy()
+    return np.lexsort((first_seen, -counts))
+
+
+def aggregate_reps(
+    name_ids: "np.ndarray", reps: "np.ndarray", n_names: int
+) -> Tuple["np.ndarray", "np.ndarray"]:
+    """Per-exercise (counts, sums) of reps, indexed by name id"""
+    _lazy_numpy()
+    offsets, grouped = group_by(name_ids, n_names, reps)
+    counts = np.diff(offsets).astype(np.int32)
+
+    # Reduce each bucket in one vectorized pass, skipping empty ones
+    present = np.flatnonzero(counts)
+    sums = np.zeros(n_names, dtype=np.int64)
+    if present.size:
+        sums[present] = np.add.reduceat(grouped.astype(np.int64), offsets[present])
+    return counts, sums
+
+
+def lttb_indices(x: "np.ndarray", y: "np.ndarray", n_out: int) -> "np.ndarray":
+    """Indices of the points Largest-Triangle-Three-Buckets keeps out of (x, y)"""
+    _lazy_numpy()
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    x = x.astype(np.float64)
+    y = y.astype(np.float64)
+    # First and last points stay; the rest split into n_out - 2 buckets
+    edges = np.arange(n_out - 1) * (n - 2) // (n_out - 2) + 1
+    edges = np.append(edges, n)
+
+    kept = np.empty(n_out, dtype=np.intp)
+    kept[0], kept[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, end, next_end = edges[i], edges[i + 1], edges[i + 2]
+        # Keep the point forming the largest triangle with the last kept
+        # point and the mean of the next bucket
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+        area = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(np.argmax(area))
+        kept[i + 1] = a
+    return kept
+
 
 class ExerciseDatabase:
     def __init__(self):
@@ -122,27 +275,82 @@ class ExerciseDatabase:
             ],
         }
 
+        for category, exercises in self.exercises.items():
+            for exercise in exercises:
+                exercise.category = category
+
+        # (category, name) -> Exercise index for O(1) lookups
+        self.by_key = {
+            (category, exercise.name): exercise
+            for category, exercises in self.exercises.items()
+            for exercise in exercises
+        }
+
+        self.category_list = tuple(self.exercises)
+
+        # category -> difficulty level -> first exercise at that level
+        self.by_level: Dict[str, Dict[int, Exercise]] = {}
+        for category, exercises in self.exercises.items():
+            levels = self.by_level[category] = {}
+            for exercise in exercises:
+                levels.setdefault(exercise.difficulty_level, exercise)
+
 
 class WorkoutSnacksApp:
     def __init__(self):
         self.data_dir = Path.home() / ".workout-snacks"
         self.data_dir.mkdir(exist_ok=True)
         self.db_file = self.data_dir / "workout_data.db"
+        self.conn = self._connect()
+        self._db_lock = threading.Lock()
 
         self.exercise_db = ExerciseDatabase()
-        self.workout_history: List[WorkoutSession] = []
+        self._history_version = 0
+        self._aggregates: Optional[HistoryAggregates] = None
+        self._aggregates_version = -1
+        self._history_arrays: Optional[HistoryArrays] = None
+        self._history_arrays_version = -1
+        self._progress_text: Optional[str] = None
+        self._progress_version = -1
+        # One chart figure is reused across renders; the lock keeps two
+        # render threads from drawing into it at once
+        self._chart_fig = None
+        self._chart_axes = None
+        self._chart_lock = threading.Lock()
+        try:
+            from apscheduler.schedulers.background import BackgroundScheduler
+        except ImportError as e:
+            _missing_dependency(e)
         self.scheduler = BackgroundScheduler()
         self.tray_icon = None
+        self._icon_normal = None
+        self._icon_warning = None
         self.next_workout_time = None
         self.warning_shown = False
 
+        self._rng = random.Random()
+        self._dirty_exercises: Set[Tuple[str, str]] = set()
+        self._current_per_category: Dict[str, Exercise] = {}
+
         self.init_database()
         self.load_data()
 
+        for category in self.exercise_db.exercises:
+            self._recompute_progression(category)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a database connection with write-friendly PRAGMAs"""
+        conn = sqlite3.connect(self.db_file, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-20000")
+        conn.execute("PRAGMA mmap_size=268435456")
+        return conn
+
     def init_database(self):
         """Initialize SQLite database"""
-        conn = sqlite3.connect(self.db_file)
-        cursor = conn.cursor()
+        cursor = self.conn.cursor()
 
         # Create exercises table
         cursor.execute("""
@@ -177,169 +385,211 @@ class WorkoutSnacksApp:
             )
         """)
 
-        conn.commit()
-        conn.close()
+        # Unix-seconds copy of the ISO timestamp (ISO is kept for workout_cli.py)
+        columns = {
+            row[1] for row in cursor.execute("PRAGMA table_info(workout_sessions)")
+        }
+        if "ts_int" not in columns:
+            cursor.execute("ALTER TABLE workout_sessions ADD COLUMN ts_int INTEGER")
+        cursor.execute("""
+            UPDATE workout_sessions
+            SET ts_int = CAST(strftime('%s', timestamp, 'utc') AS INTEGER)
+            WHERE ts_int IS NULL
+        """)
+        # workout_cli.py shares this database but only writes the ISO timestamp
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_ws_ts_int
+            AFTER INSERT ON workout_sessions
+            WHEN NEW.ts_int IS NULL
+            BEGIN
+                UPDATE workout_sessions
+                SET ts_int = CAST(strftime('%s', NEW.timestamp, 'utc') AS INTEGER)
+                WHERE id = NEW.id;
+            END
+        """)
+
+        # Indexes for the history join and the ts_int ordering of workout_history
+        # and _recent_sessions (both read ts_int directly so the index applies)
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_we_session ON workout_exercises(session_id)"
+        )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_ws_ts ON workout_sessions(ts_int)"
+        )
+
+        self.conn.commit()
 
         # Populate initial exercise data
         self.populate_initial_exercises()
 
     def populate_initial_exercises(self):
         """Populate database with initial exercise data"""
-        conn = sqlite3.connect(self.db_file)
-        cursor = conn.cursor()
-
-        for category, exercises in self.exercise_db.exercises.items():
-            for exercise in exercises:
-                cursor.execute(
-                    """
-                    INSERT OR IGNORE INTO exercises 
-                    (category, name, difficulty_level, max_reps_achieved, description) 
-                    VALUES (?, ?, ?, ?, ?)
-                """,
-                    (
-                        category,
-                        exercise.name,
-                        exercise.difficulty_level,
-                        exercise.max_reps_achieved,
-                        exercise.description,
-                    ),
-                )
+        cursor = self.conn.cursor()
+
+        rows = [
+            (
+                category,
+                exercise.name,
+                exercise.difficulty_level,
+                exercise.max_reps_achieved,
+                exercise.description,
+            )
+            for category, exercises in self.exercise_db.exercises.items()
+            for exercise in exercises
+        ]
 
-        conn.commit()
-        conn.close()
+        # Single transaction for the whole batch
+        with self._db_lock, self.conn:
+            cursor.executemany(
+                """
+                INSERT OR IGNORE INTO exercises 
+                (category, name, difficulty_level, max_reps_achieved, description) 
+                VALUES (?, ?, ?, ?, ?)
+            """,
+                rows,
+            )
 
     def load_data(self):
-        """Load workout history and exercise progress from database"""
-        conn = sqlite3.connect(self.db_file)
-        cursor = conn.cursor()
+        """Load exercise progress from database"""
+        cursor = self.conn.cursor()
 
         # Load exercise progress
         cursor.execute("SELECT category, name, max_reps_achieved FROM exercises")
         for category, name, max_reps in cursor.fetchall():
-            if category in self.exercise_db.exercises:
-                for exercise in self.exercise_db.exercises[category]:
-                    if exercise.name == name:
-                        exercise.max_reps_achieved = max_reps
-                        break
-
-        # Load workout history
-        cursor.execute("""
-            SELECT ws.timestamp, ws.duration_minutes, we.exercise_name, we.reps_completed
-            FROM workout_sessions ws
-            JOIN workout_exercises we ON ws.id = we.session_id
-            ORDER BY ws.timestamp
-        """)
-
-        sessions_data = {}
-        for timestamp, duration, exercise_name, reps in cursor.fetchall():
-            if timestamp not in sessions_data:
-                sessions_data[timestamp] = {"duration": duration, "exercises": []}
-            sessions_data[timestamp]["exercises"].append((exercise_name, reps))
-
-        for timestamp, data in sessions_data.items():
-            session = WorkoutSession(
-                timestamp=datetime.fromisoformat(timestamp),
-                exercises=data["exercises"],
-                duration_minutes=data["duration"],
-            )
-            self.workout_history.append(session)
-
-        conn.close()
-
-    def save_data(self):
-        """Save exercise progress to database"""
-        conn = sqlite3.connect(self.db_file)
-        cursor = conn.cursor()
-
-        # Update exercise progress
-        for category, exercises in self.exercise_db.exercises.items():
-            for exercise in exercises:
-                cursor.execute(
-                    """
-                    UPDATE exercises 
-                    SET max_reps_achieved = ? 
-                    WHERE category = ? AND name = ?
-                """,
-                    (exercise.max_reps_achieved, category, exercise.name),
+            exercise = self.exercise_db.by_key.get((category, name))
+            if exercise is not None:
+                exercise.max_reps_achieved = max_reps
+
+    @staticmethod
+    def _sessions_from_rows(rows) -> List[WorkoutSession]:
+        """Build sessions from _SQL_LOAD_SESSIONS-shaped rows, one per group of consecutive rows"""
+        sessions = []
+        for _, group in groupby(rows, key=itemgetter(0)):
+            group = list(group)
+            _, timestamp, duration, _, _ = group[0]
+            sessions.append(
+                WorkoutSession(
+                    timestamp=datetime.fromtimestamp(timestamp),
+                    names=[row[3] for row in group],
+                    reps=array("i", [row[4] for row in group]),
+                    duration_minutes=duration,
                 )
+            )
+        return sessions
+
+    @cached_property
+    def workout_history(self) -> List[WorkoutSession]:
+        """Full workout history, loaded on first use (stats and charts)"""
+        with self._db_lock:
+            return self._sessions_from_rows(
+                self.conn.execute(_SQL_LOAD_SESSIONS.format(where=""))
+            )
 
-        conn.commit()
-        conn.close()
+    def _recent_sessions(self, count: int) -> List[WorkoutSession]:
+        """Load only the newest sessions, oldest first"""
+        where = """
+            WHERE ws.id IN (
+                SELECT id FROM workout_sessions ORDER BY ts_int DESC, id DESC LIMIT ?
+            )
+        """
+        with self._db_lock:
+            return self._sessions_from_rows(
+                self.conn.execute(_SQL_LOAD_SESSIONS.format(where=where), (count,))
+            )
 
-    def save_workout_session(self, session: WorkoutSession):
-        """Save a workout session to database"""
-        conn = sqlite3.connect(self.db_file)
-        cursor = conn.cursor()
+    def _dirty_progress_rows(self) -> List[Tuple[int, str, str]]:
+        """UPDATE rows for exercises whose progress changed since the last save"""
+        return [
+            (self.exercise_db.by_key[key].max_reps_achieved, *key)
+            for key in self._dirty_exercises
+        ]
 
+    def _insert_session(self, cursor: sqlite3.Cursor, session: WorkoutSession):
+        """Insert a session and its exercises; the caller owns the transaction"""
         # Insert workout session
         cursor.execute(
-            """
-            INSERT INTO workout_sessions (timestamp, duration_minutes) 
-            VALUES (?, ?)
-        """,
-            (session.timestamp.isoformat(), session.duration_minutes),
+            _SQL_INSERT_SESSION,
+            (
+                session.timestamp.isoformat(),
+                int(session.timestamp.timestamp()),
+                session.duration_minutes,
+            ),
         )
-
         session_id = cursor.lastrowid
 
         # Insert workout exercises
-        for exercise_name, reps in session.exercises:
-            cursor.execute(
-                """
-                INSERT INTO workout_exercises (session_id, exercise_name, reps_completed) 
-                VALUES (?, ?, ?)
-            """,
-                (session_id, exercise_name, reps),
-            )
+        cursor.executemany(
+            _SQL_INSERT_EXERCISE,
+            [
+                (session_id, name, reps)
+                for name, reps in zip(session.names, session.reps)
+            ],
+        )
 
-        conn.commit()
-        conn.close()
+    def save_data(self):
+        """Save exercise progress to database"""
+        cursor = self.conn.cursor()
+
+        rows = self._dirty_progress_rows()
+        if not rows:
+            return
+
+        with self._db_lock, self.conn:
+            cursor.executemany(_SQL_UPDATE_EXERCISE, rows)
+
+        self._dirty_exercises.clear()
+
+    def save_finished_workout(self, session: WorkoutSession):
+        """Save a workout session and the progress it made in one transaction"""
+        cursor = self.conn.cursor()
+        rows = self._dirty_progress_rows()
+
+        with self._db_lock, self.conn:
+            self._insert_session(cursor, session)
+            if rows:
+                cursor.executemany(_SQL_UPDATE_EXERCISE, rows)
+
+        self._dirty_exercises.clear()
+        self._history_version += 1
+
+    def _recompute_progression(self, category: str):
+        """Cache the current progression level for a category"""
+        exercises = self.exercise_db.exercises[category]
+        by_level = self.exercise_db.by_level[category]
+        current_exercise = exercises[0]  # Start with easiest
+
+        # Find the appropriate difficulty level based on progression
+        for exercise in exercises:
+            if exercise.max_reps_achieved == 0:
+                # Never done this exercise, start here
+                current_exercise = exercise
+                break
+            elif exercise.max_reps_achieved >= 15:  # Lower threshold for progression
+                # Look for next level, staying at current level if none
+                current_exercise = by_level.get(exercise.difficulty_level + 1, exercise)
+            else:
+                current_exercise = exercise
+                break
+
+        self._current_per_category[category] = current_exercise
 
     def get_current_exercises(self) -> List[Exercise]:
         """Get 3 exercises for current workout based on progression"""
-        import random
-
         # Get one exercise from 3 different categories
-        available_categories = list(self.exercise_db.exercises.keys())
-        selected_categories = random.sample(
-            available_categories, min(3, len(available_categories))
-        )
+        categories = self.exercise_db.category_list
+        selected_categories = self._rng.sample(categories, min(3, len(categories)))
 
-        workout_exercises = []
+        return [
+            self._current_per_category[category] for category in selected_categories
+        ]
 
-        for category in selected_categories:
-            exercises = self.exercise_db.exercises[category]
-            current_exercise = exercises[0]  # Start with easiest
+    def _build_icon_image(self, warning_mode: bool):
+        """Draw the tray icon image for the given state"""
+        try:
+            from PIL import Image, ImageDraw
+        except ImportError as e:
+            _missing_dependency(e)
 
-            # Find the appropriate difficulty level based on progression
-            for exercise in exercises:
-                if exercise.max_reps_achieved == 0:
-                    # Never done this exercise, start here
-                    current_exercise = exercise
-                    break
-                elif (
-                    exercise.max_reps_achieved >= 15
-                ):  # Lower threshold for progression
-                    # Look for next level
-                    next_level_exercises = [
-                        e
-                        for e in exercises
-                        if e.difficulty_level == exercise.difficulty_level + 1
-                    ]
-                    if next_level_exercises:
-                        current_exercise = next_level_exercises[0]
-                    else:
-                        current_exercise = exercise  # Stay at current level
-                else:
-                    current_exercise = exercise
-                    break
-
-            workout_exercises.append(current_exercise)
-
-        return workout_exercises
-
-    def create_tray_icon(self, warning_mode=False):
-        """Create system tray icon"""
         # Create a more visible icon for Hyprland
         image = Image.new("RGBA", (64, 64), color=(0, 0, 0, 0))
         draw = ImageDraw.Draw(image)
@@ -363,6 +613,19 @@ class WorkoutSnacksApp:
         # Add "W" for workout
         draw.text((22, 18), "W", fill=(0, 0, 0, 255), anchor="mm")
 
+        return image
+
+    def create_tray_icon(self):
+        """Create system tray icon"""
+        try:
+            import pystray
+            from pystray import Menu, MenuItem
+        except ImportError as e:
+            _missing_dependency(e)
+
+        self._icon_normal = self._build_icon_image(warning_mode=False)
+        self._icon_warning = self._build_icon_image(warning_mode=True)
+
         menu = Menu(
             MenuItem("Start Workout", self.start_workout),
             MenuItem("View Progress", self.show_progress),
@@ -370,7 +633,9 @@ class WorkoutSnacksApp:
             MenuItem("Quit", self.quit_app),
         )
 
-        return pystray.Icon("workout-snacks", image, menu=menu, title="Workout Snacks")
+        return pystray.Icon(
+            "workout-snacks", self._icon_normal, menu=menu, title="Workout Snacks"
+        )
 
     def start_workout(self, icon=None, item=None):
         """Start a workout session"""
@@ -382,7 +647,8 @@ class WorkoutSnacksApp:
         print("Complete each exercise for 1 minute:")
         print()
 
-        completed_exercises = []
+        completed_names = []
+        completed_reps = array("i")
 
         for i, exercise in enumerate(exercises, 1):
             print(f"{i}. {exercise.name}")
@@ -402,22 +668,29 @@ class WorkoutSnacksApp:
                 except ValueError:
                     print("   Please enter a valid number.")
 
-            completed_exercises.append((exercise.name, reps))
+            completed_names.append(exercise.name)
+            completed_reps.append(reps)
 
             # Update personal best
             if reps > exercise.max_reps_achieved:
                 exercise.max_reps_achieved = reps
+                self._dirty_exercises.add((exercise.category, exercise.name))
                 print(f"   🎉 New personal best! ({reps} reps)")
 
             print()
 
         # Save workout session
         session = WorkoutSession(
-            timestamp=datetime.now(), exercises=completed_exercises
+            timestamp=datetime.now(), names=completed_names, reps=completed_reps
         )
-        self.workout_history.append(session)
-        self.save_workout_session(session)
-        self.save_data()
+        # Keep the history in step only if something already loaded it
+        if "workout_history" in self.__dict__:
+            self.workout_history.append(session)
+        self.save_finished_workout(session)
+
+        # Only the categories just trained can have changed level
+        for exercise in exercises:
+            self._recompute_progression(exercise.category)
 
         print("Great job! Workout completed. 💪")
         print("Next workout in 90 minutes.")
@@ -429,32 +702,133 @@ class WorkoutSnacksApp:
 
         # Update tray icon back to normal
         if self.tray_icon:
-            self.tray_icon.icon = self.create_tray_icon(warning_mode=False).icon
+            self.tray_icon.icon = self._icon_normal
 
-    def show_progress(self, icon=None, item=None):
-        """Display workout progress"""
-        print("\n" + "=" * 50)
-        print("📊 WORKOUT PROGRESS 📊")
-        print("=" * 50)
+    def _render_progress(self) -> str:
+        """Render the progress report, cached until the next workout is saved"""
+        # Progress only changes in start_workout, which also bumps the version
+        if (
+            self._progress_text is not None
+            and self._progress_version == self._history_version
+        ):
+            return self._progress_text
+
+        lines = ["\n" + "=" * 50, "📊 WORKOUT PROGRESS 📊", "=" * 50]
 
         # Show current exercise levels
-        print("Current Exercise Levels:")
+        lines.append("Current Exercise Levels:")
         for category, exercises in self.exercise_db.exercises.items():
-            print(f"\n{category.upper()}:")
-            for exercise in exercises:
-                status = "✓" if exercise.max_reps_achieved > 0 else "○"
-                print(
-                    f"  {status} {exercise.name}: {exercise.max_reps_achieved} reps (Level {exercise.difficulty_level})"
-                )
+            lines.append(f"\n{category.upper()}:")
+            lines.extend(
+                f"  {'✓' if exercise.max_reps_achieved > 0 else '○'} {exercise.name}: "
+                f"{exercise.max_reps_achieved} reps (Level {exercise.difficulty_level})"
+                for exercise in exercises
+            )
 
-        # Show recent workouts
-        print(f"\nRecent Workouts ({len(self.workout_history)} total):")
-        for session in self.workout_history[-5:]:  # Show last 5
-            print(f"  {session.timestamp.strftime('%Y-%m-%d %H:%M')}:")
-            for exercise_name, reps in session.exercises:
-                print(f"    - {exercise_name}: {reps} reps")
+        # Show recent workouts, without loading the whole history
+        with self._db_lock:
+            total_workouts = self.conn.execute(
+                "SELECT COUNT(*) FROM workout_sessions"
+            ).fetchone()[0]
+        lines.append(f"\nRecent Workouts ({total_workouts} total):")
+        for session in self._recent_sessions(5):  # Show last 5
+            lines.append(f"  {session.timestamp.strftime('%Y-%m-%d %H:%M')}:")
+            lines.extend(
+                f"    - {exercise_name}: {reps} reps"
+                for exercise_name, reps in session.exercises
+            )
 
-        print("=" * 50)
+        lines.append("=" * 50)
+
+        self._progress_text = "\n".join(lines)
+        self._progress_version = self._history_version
+        return self._progress_text
+
+    def show_progress(self, icon=None, item=None):
+        """Display workout progress"""
+        print(self._render_progress())
+
+    def _get_aggregates(self) -> HistoryAggregates:
+        """Aggregate per-day workout counts, cached until history changes"""
+        if (
+            self._aggregates is not None
+            and self._aggregates_version == self._history_version
+        ):
+            return self._aggregates
+
+        # Session days are already int ordinals in the history arrays, so
+        # this never touches a datetime
+        days = self._get_history_arrays().days
+        agg = HistoryAggregates()
+        if days.size:
+            first_day, last_day = int(days.min()), int(days.max())
+            day_counts = np.bincount(days - first_day)
+            busiest = int(np.argmax(day_counts))  # earliest day on ties
+            agg = HistoryAggregates(
+                first_date=date.fromordinal(first_day + _EPOCH_ORDINAL),
+                last_date=date.fromordinal(last_day + _EPOCH_ORDINAL),
+                busiest_date=date.fromordinal(first_day + busiest + _EPOCH_ORDINAL),
+                busiest_count=int(day_counts[busiest]),
+            )
+
+        self._aggregates = agg
+        self._aggregates_version = self._history_version
+        return agg
+
+    def _get_history_arrays(self) -> HistoryArrays:
+        """Flatten history into per-rep and per-session arrays"""
+        _lazy_numpy()
+        if (
+            self._history_arrays is not None
+            and self._history_arrays_version == self._history_version
+        ):
+            return self._history_arrays
+
+        names = np.array(
+            [name for session in self.workout_history for name in session.names],
+            dtype=object,
+        )
+        # array("i") buffers are viewed without copying, then joined once
+        reps = np.concatenate(
+            [
+                np.frombuffer(session.reps, dtype=np.intc)
+                for session in self.workout_history
+            ]
+            or [np.empty(0, dtype=np.intc)]
+        )
+        # Local calendar day of each session, as days since the Unix epoch
+        days = (
+            np.fromiter(
+                (session.timestamp.toordinal() for session in self.workout_history),
+                dtype=np.int32,
+                count=len(self.workout_history),
+            )
+            - _EPOCH_ORDINAL
+        )
+        rep_days = np.repeat(
+            days,
+            np.fromiter(
+                (len(session.names) for session in self.workout_history),
+                dtype=np.intp,
+                count=len(self.workout_history),
+            ),
+        )
+
+        # Names are factorized once here and shared by stats and charts
+        unique_names, first_seen, name_ids = np.unique(
+            names, return_index=True, return_inverse=True
+        )
+
+        self._history_arrays = HistoryArrays(
+            unique_names=unique_names,
+            name_ids=name_ids,
+            first_seen=first_seen,
+            reps=reps,
+            rep_days=rep_days,
+            days=days,
+        )
+        self._history_arrays_version = self._history_version
+        return self._history_arrays
 
     def show_charts(self, icon=None, item=None):
         """Display workout visualization charts"""
@@ -462,88 +836,116 @@ class WorkoutSnacksApp:
             print("No workout data available for charts.")
             return
 
-        # Create subplots
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 12))
-        fig.suptitle("Workout Analytics", fontsize=16, fontweight="bold")
-
-        # Prepare data
-        dates = [session.timestamp.date() for session in self.workout_history]
-        date_counts = Counter(dates)
-
-        # Chart 1: Workouts per day
-        sorted_dates = sorted(date_counts.keys())
-        workout_counts = [date_counts[date] for date in sorted_dates]
-
-        ax1.bar(sorted_dates, workout_counts, color="skyblue", alpha=0.7)
-        ax1.set_title("Workouts per Day")
-        ax1.set_xlabel("Date")
-        ax1.set_ylabel("Number of Workouts")
-        ax1.tick_params(axis="x", rotation=45)
-
-        # Chart 2: Reps per minute trend
-        exercise_reps = defaultdict(list)
-        exercise_dates = defaultdict(list)
-
-        for session in self.workout_history:
-            for exercise_name, reps in session.exercises:
-                exercise_reps[exercise_name].append(reps)
-                exercise_dates[exercise_name].append(session.timestamp.date())
-
-        # Plot top 3 exercises by frequency
-        top_exercises = sorted(
-            exercise_reps.keys(), key=lambda x: len(exercise_reps[x]), reverse=True
-        )[:3]
-        colors = ["red", "green", "blue"]
-
-        for i, exercise in enumerate(top_exercises):
-            ax2.plot(
-                exercise_dates[exercise],
-                exercise_reps[exercise],
-                marker="o",
-                label=exercise,
-                color=colors[i],
-                alpha=0.7,
+        threading.Thread(target=self._render_charts, daemon=True).start()
+
+    def _render_charts(self):
+        """Render workout charts to a PNG and open it"""
+        _lazy_figure()
+
+        with self._chart_lock:
+            # Create subplots once, then clear and redraw them on later calls
+            if self._chart_fig is None:
+                self._chart_fig = Figure(figsize=(15, 12))
+                self._chart_axes = self._chart_fig.subplots(2, 2)
+                self._chart_fig.suptitle(
+                    "Workout Analytics", fontsize=16, fontweight="bold"
+                )
+            else:
+                for ax in self._chart_axes.flat:
+                    ax.clear()
+            fig = self._chart_fig
+            (ax1, ax2), (ax3, ax4) = self._chart_axes
+
+            # Prepare data
+            arrays = self._get_history_arrays()
+            unique_names, days_arr = arrays.unique_names, arrays.days
+            offsets, grouped_reps, grouped_days = group_by(
+                arrays.name_ids, len(unique_names), arrays.reps, arrays.rep_days
             )
+            name_counts = np.diff(offsets)
+            by_frequency = rank_by_frequency(name_counts, arrays.first_seen)
+
+            # Chart 1: Workouts per day
+            first_day = days_arr.min()
+            day_counts = np.bincount(days_arr - first_day)
+            active_days = np.flatnonzero(day_counts)
+            sorted_dates = (active_days + first_day).astype("datetime64[D]")
+            workout_counts = day_counts[active_days]
+
+            ax1.bar(sorted_dates, workout_counts, color="skyblue", alpha=0.7)
+            ax1.set_title("Workouts per Day")
+            ax1.set_xlabel("Date")
+            ax1.set_ylabel("Number of Workouts")
+            ax1.tick_params(axis="x", rotation=45)
+
+            # Chart 2: Reps per minute trend
+            # Plot top 3 exercises by frequency
+            colors = ["red", "green", "blue"]
+
+            for i, name_id in enumerate(by_frequency[:3]):
+                bucket = slice(offsets[name_id], offsets[name_id + 1])
+                # One point per day: mean reps across that day's sessions
+                days, day_index = np.unique(grouped_days[bucket], return_inverse=True)
+                daily_means = np.bincount(
+                    day_index, weights=grouped_reps[bucket]
+                ) / np.bincount(day_index)
+                if len(days) > _MAX_TREND_POINTS:
+                    kept = lttb_indices(days, daily_means, _TREND_POINTS)
+                    days, daily_means = days[kept], daily_means[kept]
+                ax2.plot(
+                    days.astype("datetime64[D]"),
+                    daily_means,
+                    marker="o",
+                    label=unique_names[name_id],
+                    color=colors[i],
+                    alpha=0.7,
+                )
 
-        ax2.set_title("Reps per Minute Trend (Top 3 Exercises)")
-        ax2.set_xlabel("Date")
-        ax2.set_ylabel("Reps per Minute")
-        ax2.legend()
-        ax2.tick_params(axis="x", rotation=45)
-
-        # Chart 3: Exercise distribution
-        all_exercises = [
-            exercise_name
-            for session in self.workout_history
-            for exercise_name, _ in session.exercises
-        ]
-        exercise_counts = Counter(all_exercises)
+            ax2.set_title("Reps per Minute Trend (Top 3 Exercises)")
+            ax2.set_xlabel("Date")
+            ax2.set_ylabel("Reps per Minute")
+            ax2.legend()
+            ax2.tick_params(axis="x", rotation=45)
+
+            # Chart 3: Exercise distribution
+            top_pie = by_frequency[:6]
+            pie_counts = name_counts[top_pie]
+            # Percentages go into the labels rather than autopct's per-wedge texts
+            pie_shares = 100 * pie_counts / pie_counts.sum()
+            ax3.pie(
+                pie_counts,
+                labels=[
+                    f"{name}\n{share:.1f}%"
+                    for name, share in zip(unique_names[top_pie], pie_shares)
+                ],
+            )
+            ax3.set_title("Exercise Distribution")
 
-        top_exercises_pie = dict(Counter(all_exercises).most_common(6))
-        ax3.pie(
-            top_exercises_pie.values(),
-            labels=top_exercises_pie.keys(),
-            autopct="%1.1f%%",
-        )
-        ax3.set_title("Exercise Distribution")
+            # Chart 4: Personal best progression (names shared across categories
+            # keep their last value, as one bar each)
+            pb_data = {
+                exercise.name: exercise.max_reps_achieved
+                for exercise in self.exercise_db.by_key.values()
+                if exercise.max_reps_achieved > 0
+            }
 
-        # Chart 4: Personal best progression
-        pb_data = {}
-        for category, exercises in self.exercise_db.exercises.items():
-            for exercise in exercises:
-                if exercise.max_reps_achieved > 0:
-                    pb_data[f"{exercise.name}"] = exercise.max_reps_achieved
+            if pb_data:
+                sorted_pb = heapq.nlargest(8, pb_data.items(), key=itemgetter(1))
+                names, values = zip(*sorted_pb)
 
-        if pb_data:
-            sorted_pb = sorted(pb_data.items(), key=lambda x: x[1], reverse=True)[:8]
-            names, values = zip(*sorted_pb)
+                ax4.barh(names, values, color="lightgreen", alpha=0.7)
+                ax4.set_title("Personal Bests")
+                ax4.set_xlabel("Max Reps Achieved")
 
-            ax4.barh(names, values, color="lightgreen", alpha=0.7)
-            ax4.set_title("Personal Bests")
-            ax4.set_xlabel("Max Reps Achieved")
+            fig.tight_layout()
+            chart_file = self.data_dir / "workout_charts.png"
+            fig.savefig(chart_file, dpi=110)
 
-        plt.tight_layout()
-        plt.show()
+        try:
+            subprocess.Popen(["xdg-open", str(chart_file)])
+        except OSError:
+            pass
+        print(f"Charts saved to: {chart_file}")
 
         # Also show summary stats
         self.show_workout_stats()
@@ -553,58 +955,59 @@ class WorkoutSnacksApp:
         if not self.workout_history:
             return
 
-        print("\n" + "=" * 50)
-        print("📈 DETAILED WORKOUT STATISTICS 📈")
-        print("=" * 50)
+        _lazy_numpy()
+
+        lines = []
+        lines.append("\n" + "=" * 50)
+        lines.append("📈 DETAILED WORKOUT STATISTICS 📈")
+        lines.append("=" * 50)
 
         # Total workouts
         total_workouts = len(self.workout_history)
-        print(f"Total Workouts: {total_workouts}")
+        lines.append(f"Total Workouts: {total_workouts}")
+
+        agg = self._get_aggregates()
+        first_workout, last_workout = agg.first_date, agg.last_date
+
+        arrays = self._get_history_arrays()
+        unique_names = arrays.unique_names
+        counts, sums = aggregate_reps(arrays.name_ids, arrays.reps, len(unique_names))
 
         # Workouts per day average
         if total_workouts > 0:
-            first_workout = min(
-                session.timestamp.date() for session in self.workout_history
-            )
-            last_workout = max(
-                session.timestamp.date() for session in self.workout_history
-            )
             days_active = (last_workout - first_workout).days + 1
             avg_per_day = total_workouts / days_active
-            print(f"Average Workouts per Day: {avg_per_day:.2f}")
+            lines.append(f"Average Workouts per Day: {avg_per_day:.2f}")
 
             # Most active day
-            dates = [session.timestamp.date() for session in self.workout_history]
-            date_counts = Counter(dates)
-            most_active_date, max_workouts = date_counts.most_common(1)[0]
-            print(f"Most Active Day: {most_active_date} ({max_workouts} workouts)")
+            lines.append(
+                f"Most Active Day: {agg.busiest_date} ({agg.busiest_count} workouts)"
+            )
 
             # Exercise statistics
-            all_exercises = [
-                exercise_name
-                for session in self.workout_history
-                for exercise_name, _ in session.exercises
-            ]
-            exercise_counts = Counter(all_exercises)
-            print(
-                f"\nMost Frequent Exercise: {exercise_counts.most_common(1)[0][0]} ({exercise_counts.most_common(1)[0][1]} times)"
+            most_frequent = int(rank_by_frequency(counts, arrays.first_seen)[0])
+            lines.append(
+                f"\nMost Frequent Exercise: {unique_names[most_frequent]} ({counts[most_frequent]} times)"
             )
 
-            # Average reps per exercise
-            exercise_reps = defaultdict(list)
-            for session in self.workout_history:
-                for exercise_name, reps in session.exercises:
-                    exercise_reps[exercise_name].append(reps)
-
-            print("\nAverage Reps per Exercise:")
-            for exercise, reps_list in sorted(exercise_reps.items()):
-                avg_reps = sum(reps_list) / len(reps_list)
-                print(f"  {exercise}: {avg_reps:.1f} reps")
+            lines.append("\nAverage Reps per Exercise:")
+            lines.extend(
+                f"  {exercise}: {total / count:.1f} reps"
+                for exercise, count, total in zip(unique_names, counts, sums)
+            )
 
-        print("=" * 50)
+        lines.append("=" * 50)
+        print("\n".join(lines))
 
     def send_notification(self, title, message, timeout=10):
         """Send desktop notification"""
+        try:
+            from plyer import notification
+        except ImportError as e:
+            print(f"Notification error: {e}")
+            print(_INSTALL_HINT)
+            return
+
         try:
             notification.notify(
                 title=title, message=message, timeout=timeout, app_name="Workout Snacks"
@@ -621,6 +1024,9 @@ class WorkoutSnacksApp:
         )
         print(f"[{datetime.now().strftime('%H:%M:%S')}] Workout reminder sent!")
 
+        # Allow the warning for the following cycle
+        self.warning_shown = False
+
     def workout_warning(self):
         """Show warning 30 minutes before workout"""
         if not self.warning_shown:
@@ -632,27 +1038,40 @@ class WorkoutSnacksApp:
 
             # Change tray icon to warning mode
             if self.tray_icon:
-                self.tray_icon.icon = self.create_tray_icon(warning_mode=True).icon
+                self.tray_icon.icon = self._icon_warning
 
             self.warning_shown = True
             print(f"[{datetime.now().strftime('%H:%M:%S')}] Workout warning sent!")
 
     def schedule_next_workout(self):
         """Schedule the next workout and warning"""
-        # Clear existing jobs
-        self.scheduler.remove_all_jobs()
-
-        # Schedule next workout in 90 minutes
-        workout_time = datetime.now() + timedelta(minutes=90)
+        workout_time = datetime.now() + timedelta(minutes=WORKOUT_INTERVAL_MINUTES)
         warning_time = workout_time - timedelta(minutes=30)
 
-        self.scheduler.add_job(
-            self.workout_reminder, "date", run_date=workout_time, id="workout_reminder"
-        )
-
-        self.scheduler.add_job(
-            self.workout_warning, "date", run_date=warning_time, id="workout_warning"
-        )
+        if self.scheduler.get_job("workout_reminder") is None:
+            # Recurring jobs are registered once and only moved afterwards
+            try:
+                from apscheduler.triggers.interval import IntervalTrigger
+            except ImportError as e:
+                _missing_dependency(e)
+
+            self.scheduler.add_job(
+                self.workout_reminder,
+                IntervalTrigger(
+                    minutes=WORKOUT_INTERVAL_MINUTES, start_date=workout_time
+                ),
+                id="workout_reminder",
+            )
+            self.scheduler.add_job(
+                self.workout_warning,
+                IntervalTrigger(
+                    minutes=WORKOUT_INTERVAL_MINUTES, start_date=warning_time
+                ),
+                id="workout_warning",
+            )
+        else:
+            self.scheduler.modify_job("workout_reminder", next_run_time=workout_time)
+            self.scheduler.modify_job("workout_warning", next_run_time=warning_time)
 
         self.next_workout_time = workout_time
         print(f"Next workout scheduled for: {workout_time.strftime('%H:%M:%S')}")
@@ -662,6 +1081,7 @@ class WorkoutSnacksApp:
         """Quit the application"""
         print("Shutting down Workout Snacks...")
         self.save_data()
+        self.conn.close()
         self.scheduler.shutdown()
         if self.tray_icon:
             self.tray_icon.stop()
@@ -4,10 +4,29 @@ Exercise Database Population Script
 Populates the workout database with extensive exercise progressions based on available equipment.
 """
 
+import argparse
 import sqlite3
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import Dict, FrozenSet, Optional, Set, Tuple
+
+AVAILABLE_EQUIPMENT = {
+    "pullup_bar": "Pull-up bar (or any hanging bar)",
+    "dumbbells": "Dumbbells (adjustable or fixed weight)",
+    "barbell": "Barbell with weights",
+    "treadmill": "Treadmill or running machine"
+}
+
+# One bit per equipment type, so equipment sets compare as plain ints
+_EQUIP_BITS = {equipment: 1 << i for i, equipment in enumerate(AVAILABLE_EQUIPMENT)}
+
+
+def _pack_equipment(equipment: Set[str]) -> int:
+    """Pack an equipment set into its _EQUIP_BITS bitmask"""
+    mask = 0
+    for item in equipment:
+        mask |= _EQUIP_BITS[item]
+    return mask
 
 
 @dataclass
@@ -15,8 +34,186 @@ class Exercise:
     name: str
     difficulty_level: int
     description: str
-    equipment_required: Set[str]
+    equipment_required: FrozenSet[str]
     max_reps_achieved: int = 0
+    equipment_str: str = field(init=False)
+    equipment_mask: int = field(init=False)
+
+    def __post_init__(self):
+        # Freeze the equipment set and serialize it once for database inserts
+        self.equipment_required = frozenset(self.equipment_required)
+        self.equipment_str = ','.join(sorted(self.equipment_required))
+        self.equipment_mask = _pack_equipment(self.equipment_required)
+
+
+# Upsert keyed on idx_exercises_cat_name; rows that already match are left
+# untouched, so a re-run only writes what changed
+_UPSERT_SQL = """
+    INSERT INTO exercises
+    (category, name, difficulty_level, max_reps_achieved, description, equipment_required)
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT(category, name) DO UPDATE SET
+        difficulty_level = excluded.difficulty_level,
+        max_reps_achieved = excluded.max_reps_achieved,
+        description = excluded.description,
+        equipment_required = excluded.equipment_required
+    WHERE (difficulty_level, max_reps_achieved, description, equipment_required)
+        IS NOT (excluded.difficulty_level, excluded.max_reps_achieved,
+                excluded.description, excluded.equipment_required)
+"""
+_DELETE_SQL = "DELETE FROM exercises WHERE category = ? AND name = ?"
+
+# Bump when the exercises table layout changes
+SCHEMA_VERSION = 2
+
+# Full exercise catalog, built once at import and filtered per user
+_EXERCISE_CATALOG: Dict[str, Tuple[Exercise, ...]] = {
+    "pushups": (
+        Exercise("Wall Push-ups", 1, "Push against wall", set()),
+        Exercise("Incline Push-ups", 2, "Hands on elevated surface", set()),
+        Exercise("Knee Push-ups", 3, "Push-ups on knees", set()),
+        Exercise("Regular Push-ups", 4, "Standard push-ups", set()),
+        Exercise("Wide Push-ups", 5, "Hands wider than shoulders", set()),
+        Exercise("Diamond Push-ups", 6, "Hands in diamond shape", set()),
+        Exercise("Decline Push-ups", 7, "Feet elevated", set()),
+        Exercise("Pike Push-ups", 8, "Inverted V position", set()),
+        Exercise("Archer Push-ups", 9, "One-sided push-ups", set()),
+        Exercise("Single Arm Push-ups", 10, "One arm push-ups", set()),
+        Exercise("Handstand Push-ups", 11, "Against wall handstand push-ups", set()),
+        Exercise("Freestanding Handstand Push-ups", 12, "Freestanding handstand push-ups", set()),
+        Exercise("Planche Push-ups", 13, "Advanced planche position", set()),
+        Exercise("Weighted Push-ups", 8, "Push-ups with weight vest/backpack", {"dumbbells"}),
+        Exercise("Dumbbell Press", 6, "Lying dumbbell chest press", {"dumbbells"}),
+        Exercise("Dumbbell Flyes", 7, "Lying dumbbell flyes", {"dumbbells"}),
+        Exercise("Barbell Bench Press", 5, "Barbell bench press", {"barbell"}),
+        Exercise("Incline Barbell Press", 8, "Incline barbell press", {"barbell"}),
+    ),
+    
+    "squats": (
+        Exercise("Chair Squats", 1, "Assisted squats with chair", set()),
+        Exercise("Box Squats", 2, "Squats to seated position", set()),
+        Exercise("Air Squats", 3, "Bodyweight squats", set()),
+        Exercise("Sumo Squats", 4, "Wide stance squats", set()),
+        Exercise("Jump Squats", 5, "Explosive squat jumps", set()),
+        Exercise("Bulgarian Split Squats", 6, "Rear foot elevated", set()),
+        Exercise("Cossack Squats", 7, "Side-to-side squats", set()),
+        Exercise("Single Leg Squats", 8, "Pistol squats progression", set()),
+        Exercise("Pistol Squats", 9, "Full pistol squats", set()),
+        Exercise("Jump Pistol Squats", 10, "Explosive pistol squats", set()),
+        Exercise("Shrimp Squats", 11, "Advanced single leg squat", set()),
+        Exercise("Dragon Squats", 12, "Advanced shrimp squat variation", set()),
+        Exercise("Goblet Squats", 4, "Squats holding weight", {"dumbbells"}),
+        Exercise("Dumbbell Squats", 5, "Squats with dumbbells", {"dumbbells"}),
+        Exercise("Dumbbell Lunges", 6, "Walking lunges with dumbbells", {"dumbbells"}),
+        Exercise("Barbell Back Squats", 7, "Barbell on back squats", {"barbell"}),
+        Exercise("Barbell Front Squats", 8, "Barbell front-loaded squats", {"barbell"}),
+        Exercise("Barbell Lunges", 7, "Lunges with barbell", {"barbell"}),
+    ),
+    
+    "pullups": (
+        Exercise("Dead Hangs", 1, "Hanging from bar", {"pullup_bar"}),
+        Exercise("Scapular Pulls", 2, "Shoulder blade engagement", {"pullup_bar"}),
+        Exercise("Negative Pull-ups", 3, "Slow descent from top", {"pullup_bar"}),
+        Exercise("Assisted Pull-ups", 4, "Band or partner assisted", {"pullup_bar"}),
+        Exercise("Regular Pull-ups", 5, "Standard pull-ups", {"pullup_bar"}),
+        Exercise("Wide Grip Pull-ups", 6, "Wide grip variation", {"pullup_bar"}),
+        Exercise("Chin-ups", 7, "Underhand grip", {"pullup_bar"}),
+        Exercise("L-sit Pull-ups", 8, "Pull-ups with L-sit", {"pullup_bar"}),
+        Exercise("Commando Pull-ups", 9, "Side-to-side pull-ups", {"pullup_bar"}),
+        Exercise("Archer Pull-ups", 10, "One-sided pull-ups", {"pullup_bar"}),
+        Exercise("Weighted Pull-ups", 11, "Add weight", {"pullup_bar", "dumbbells"}),
+        Exercise("One Arm Pull-ups", 12, "Single arm pull-ups", {"pullup_bar"}),
+        Exercise("Muscle-ups", 13, "Pull-up to dip transition", {"pullup_bar"}),
+        Exercise("Dumbbell Rows", 5, "Bent over dumbbell rows", {"dumbbells"}),
+        Exercise("Single Arm Dumbbell Rows", 6, "One arm dumbbell rows", {"dumbbells"}),
+        Exercise("Barbell Rows", 7, "Bent over barbell rows", {"barbell"}),
+        Exercise("Barbell Deadlifts", 8, "Conventional deadlifts", {"barbell"}),
+    ),
+    
+    "core": (
+        Exercise("Dead Bug", 1, "Lying core stability exercise", set()),
+        Exercise("Crunches", 2, "Basic abdominal crunches", set()),
+        Exercise("Plank", 3, "Hold plank position (seconds)", set()),
+        Exercise("Side Plank", 4, "Side plank hold", set()),
+        Exercise("Bicycle Crunches", 5, "Alternating elbow to knee", set()),
+        Exercise("Russian Twists", 6, "Seated twisting motion", set()),
+        Exercise("Mountain Climbers", 7, "Running in plank position", set()),
+        Exercise("Hollow Body Hold", 8, "Hollow position hold", set()),
+        Exercise("V-ups", 9, "Full body sit-ups", set()),
+        Exercise("L-sits", 10, "Legs at 90 degrees", set()),
+        Exercise("Hanging Knee Raises", 8, "Hanging leg raises", {"pullup_bar"}),
+        Exercise("Hanging L-sits", 10, "L-sits from pull-up bar", {"pullup_bar"}),
+        Exercise("Dragon Flags", 11, "Advanced core exercise", set()),
+        Exercise("Human Flag", 12, "Side plank on pole", {"pullup_bar"}),
+        Exercise("Weighted Russian Twists", 7, "Russian twists with weight", {"dumbbells"}),
+        Exercise("Weighted Plank", 6, "Plank with weight on back", {"dumbbells"}),
+    ),
+    
+    "dips": (
+        Exercise("Assisted Dips", 1, "Band or partner assisted", set()),
+        Exercise("Bench Dips", 2, "Feet on ground", set()),
+        Exercise("Elevated Bench Dips", 3, "Feet elevated", set()),
+        Exercise("Chair Dips", 4, "Using two chairs", set()),
+        Exercise("Parallel Bar Dips", 5, "Standard dips", {"pullup_bar"}),
+        Exercise("Ring Dips", 6, "On gymnastic rings", {"pullup_bar"}),
+        Exercise("Weighted Dips", 7, "Add weight", {"pullup_bar", "dumbbells"}),
+        Exercise("Archer Dips", 8, "One-sided dips", {"pullup_bar"}),
+        Exercise("Single Bar Dips", 9, "On single bar", {"pullup_bar"}),
+        Exercise("Impossible Dips", 10, "Advanced ring dips", {"pullup_bar"}),
+    ),
+    
+    "cardio": (
+        Exercise("Marching in Place", 1, "Low impact marching", set()),
+        Exercise("Jumping Jacks", 2, "Basic jumping jacks", set()),
+        Exercise("High Knees", 3, "Running in place", set()),
+        Exercise("Butt Kickers", 4, "Heel to glute kicks", set()),
+        Exercise("Burpees", 5, "Full body exercise", set()),
+        Exercise("Mountain Climbers", 6, "Fast mountain climbers", set()),
+        Exercise("Star Jumps", 7, "Explosive star position", set()),
+        Exercise("Tuck Jumps", 8, "Knees to chest jumps", set()),
+        Exercise("Squat Jumps", 9, "Continuous squat jumps", set()),
+        Exercise("Burpee Box Jumps", 10, "Burpee with box jump", set()),
+        Exercise("Devil Press", 11, "Burpee with dumbbells", {"dumbbells"}),
+        Exercise("Dumbbell Swings", 6, "Kettlebell swing motion with dumbbell", {"dumbbells"}),
+        Exercise("Dumbbell Thrusters", 8, "Squat to overhead press", {"dumbbells"}),
+        Exercise("Treadmill Walk", 2, "Brisk walking", {"treadmill"}),
+        Exercise("Treadmill Jog", 4, "Light jogging", {"treadmill"}),
+        Exercise("Treadmill Run", 6, "Moderate running", {"treadmill"}),
+        Exercise("Treadmill Sprint Intervals", 8, "High intensity intervals", {"treadmill"}),
+        Exercise("Treadmill Hill Walk", 5, "Incline walking", {"treadmill"}),
+        Exercise("Treadmill Hill Run", 9, "Incline running", {"treadmill"}),
+    ),
+    
+    "yoga": (
+        Exercise("Child's Pose", 1, "Restorative kneeling pose", set()),
+        Exercise("Cat-Cow Stretch", 2, "Spinal mobility exercise", set()),
+        Exercise("Downward Dog", 3, "Inverted V stretch", set()),
+        Exercise("Sun Salutation A", 4, "Basic sun salutation sequence", set()),
+        Exercise("Warrior I", 5, "Standing lunge pose", set()),
+        Exercise("Warrior II", 6, "Standing wide-legged pose", set()),
+        Exercise("Triangle Pose", 7, "Standing side stretch", set()),
+        Exercise("Tree Pose", 8, "Standing balance pose", set()),
+        Exercise("Crow Pose", 9, "Arm balance pose", set()),
+        Exercise("Headstand", 10, "Inverted balance pose", set()),
+        Exercise("Handstand", 11, "Advanced inverted pose", set()),
+        Exercise("Scorpion Pose", 12, "Advanced backbend inversion", set()),
+    ),
+    
+    "stretches": (
+        Exercise("Neck Rolls", 1, "Gentle neck mobility", set()),
+        Exercise("Shoulder Rolls", 2, "Shoulder mobility", set()),
+        Exercise("Arm Circles", 3, "Dynamic arm stretches", set()),
+        Exercise("Hip Circles", 4, "Hip mobility exercise", set()),
+        Exercise("Leg Swings", 5, "Dynamic leg stretches", set()),
+        Exercise("Hamstring Stretch", 6, "Seated or standing hamstring stretch", set()),
+        Exercise("Quad Stretch", 7, "Standing quadriceps stretch", set()),
+        Exercise("Calf Stretch", 8, "Wall or standing calf stretch", set()),
+        Exercise("Hip Flexor Stretch", 9, "Lunge position hip flexor stretch", set()),
+        Exercise("Pigeon Pose", 10, "Deep hip opener", set()),
+        Exercise("Butterfly Stretch", 11, "Seated groin stretch", set()),
+        Exercise("Spinal Twist", 12, "Seated or lying spinal rotation", set()),
+    )
+}
 
 
 class ExercisePopulator:
@@ -24,154 +221,6 @@ class ExercisePopulator:
         self.data_dir = Path.home() / ".workout-snacks"
         self.data_dir.mkdir(exist_ok=True)
         self.db_file = self.data_dir / "workout_data.db"
-        
-        self.equipment_exercises = {
-            "pushups": [
-                Exercise("Wall Push-ups", 1, "Push against wall", set()),
-                Exercise("Incline Push-ups", 2, "Hands on elevated surface", set()),
-                Exercise("Knee Push-ups", 3, "Push-ups on knees", set()),
-                Exercise("Regular Push-ups", 4, "Standard push-ups", set()),
-                Exercise("Wide Push-ups", 5, "Hands wider than shoulders", set()),
-                Exercise("Diamond Push-ups", 6, "Hands in diamond shape", set()),
-                Exercise("Decline Push-ups", 7, "Feet elevated", set()),
-                Exercise("Pike Push-ups", 8, "Inverted V position", set()),
-                Exercise("Archer Push-ups", 9, "One-sided push-ups", set()),
-                Exercise("Single Arm Push-ups", 10, "One arm push-ups", set()),
-                Exercise("Handstand Push-ups", 11, "Against wall handstand push-ups", set()),
-                Exercise("Freestanding Handstand Push-ups", 12, "Freestanding handstand push-ups", set()),
-                Exercise("Planche Push-ups", 13, "Advanced planche position", set()),
-                Exercise("Weighted Push-ups", 8, "Push-ups with weight vest/backpack", {"dumbbells"}),
-                Exercise("Dumbbell Press", 6, "Lying dumbbell chest press", {"dumbbells"}),
-                Exercise("Dumbbell Flyes", 7, "Lying dumbbell flyes", {"dumbbells"}),
-                Exercise("Barbell Bench Press", 5, "Barbell bench press", {"barbell"}),
-                Exercise("Incline Barbell Press", 8, "Incline barbell press", {"barbell"}),
-            ],
-            
-            "squats": [
-                Exercise("Chair Squats", 1, "Assisted squats with chair", set()),
-                Exercise("Box Squats", 2, "Squats to seated position", set()),
-                Exercise("Air Squats", 3, "Bodyweight squats", set()),
-                Exercise("Sumo Squats", 4, "Wide stance squats", set()),
-                Exercise("Jump Squats", 5, "Explosive squat jumps", set()),
-                Exercise("Bulgarian Split Squats", 6, "Rear foot elevated", set()),
-                Exercise("Cossack Squats", 7, "Side-to-side squats", set()),
-                Exercise("Single Leg Squats", 8, "Pistol squats progression", set()),
-                Exercise("Pistol Squats", 9, "Full pistol squats", set()),
-                Exercise("Jump Pistol Squats", 10, "Explosive pistol squats", set()),
-                Exercise("Shrimp Squats", 11, "Advanced single leg squat", set()),
-                Exercise("Dragon Squats", 12, "Advanced shrimp squat variation", set()),
-                Exercise("Goblet Squats", 4, "Squats holding weight", {"dumbbells"}),
-                Exercise("Dumbbell Squats", 5, "Squats with dumbbells", {"dumbbells"}),
-                Exercise("Dumbbell Lunges", 6, "Walking lunges with dumbbells", {"dumbbells"}),
-                Exercise("Barbell Back Squats", 7, "Barbell on back squats", {"barbell"}),
-                Exercise("Barbell Front Squats", 8, "Barbell front-loaded squats", {"barbell"}),
-                Exercise("Barbell Lunges", 7, "Lunges with barbell", {"barbell"}),
-            ],
-            
-            "pullups": [
-                Exercise("Dead Hangs", 1, "Hanging from bar", {"pullup_bar"}),
-                Exercise("Scapular Pulls", 2, "Shoulder blade engagement", {"pullup_bar"}),
-                Exercise("Negative Pull-ups", 3, "Slow descent from top", {"pullup_bar"}),
-                Exercise("Assisted Pull-ups", 4, "Band or partner assisted", {"pullup_bar"}),
-                Exercise("Regular Pull-ups", 5, "Standard pull-ups", {"pullup_bar"}),
-                Exercise("Wide Grip Pull-ups", 6, "Wide grip variation", {"pullup_bar"}),
-                Exercise("Chin-ups", 7, "Underhand grip", {"pullup_bar"}),
-                Exercise("L-sit Pull-ups", 8, "Pull-ups with L-sit", {"pullup_bar"}),
-                Exercise("Commando Pull-ups", 9, "Side-to-side pull-ups", {"pullup_bar"}),
-                Exercise("Archer Pull-ups", 10, "One-sided pull-ups", {"pullup_bar"}),
-                Exercise("Weighted Pull-ups", 11, "Add weight", {"pullup_bar", "dumbbells"}),
-                Exercise("One Arm Pull-ups", 12, "Single arm pull-ups", {"pullup_bar"}),
-                Exercise("Muscle-ups", 13, "Pull-up to dip transition", {"pullup_bar"}),
-                Exercise("Dumbbell Rows", 5, "Bent over dumbbell rows", {"dumbbells"}),
-                Exercise("Single Arm Dumbbell Rows", 6, "One arm dumbbell rows", {"dumbbells"}),
-                Exercise("Barbell Rows", 7, "Bent over barbell rows", {"barbell"}),
-                Exercise("Barbell Deadlifts", 8, "Conventional deadlifts", {"barbell"}),
-            ],
-            
-            "core": [
-                Exercise("Dead Bug", 1, "Lying core stability exercise", set()),
-                Exercise("Crunches", 2, "Basic abdominal crunches", set()),
-                Exercise("Plank", 3, "Hold plank position (seconds)", set()),
-                Exercise("Side Plank", 4, "Side plank hold", set()),
-                Exercise("Bicycle Crunches", 5, "Alternating elbow to knee", set()),
-                Exercise("Russian Twists", 6, "Seated twisting motion", set()),
-                Exercise("Mountain Climbers", 7, "Running in plank position", set()),
-                Exercise("Hollow Body Hold", 8, "Hollow position hold", set()),
-                Exercise("V-ups", 9, "Full body sit-ups", set()),
-                Exercise("L-sits", 10, "Legs at 90 degrees", set()),
-                Exercise("Hanging Knee Raises", 8, "Hanging leg raises", {"pullup_bar"}),
-                Exercise("Hanging L-sits", 10, "L-sits from pull-up bar", {"pullup_bar"}),
-                Exercise("Dragon Flags", 11, "Advanced core exercise", set()),
-                Exercise("Human Flag", 12, "Side plank on pole", {"pullup_bar"}),
-                Exercise("Weighted Russian Twists", 7, "Russian twists with weight", {"dumbbells"}),
-                Exercise("Weighted Plank", 6, "Plank with weight on back", {"dumbbells"}),
-            ],
-            
-            "dips": [
-                Exercise("Assisted Dips", 1, "Band or partner assisted", set()),
-                Exercise("Bench Dips", 2, "Feet on ground", set()),
-                Exercise("Elevated Bench Dips", 3, "Feet elevated", set()),
-                Exercise("Chair Dips", 4, "Using two chairs", set()),
-                Exercise("Parallel Bar Dips", 5, "Standard dips", {"pullup_bar"}),
-                Exercise("Ring Dips", 6, "On gymnastic rings", {"pullup_bar"}),
-                Exercise("Weighted Dips", 7, "Add weight", {"pullup_bar", "dumbbells"}),
-                Exercise("Archer Dips", 8, "One-sided dips", {"pullup_bar"}),
-                Exercise("Single Bar Dips", 9, "On single bar", {"pullup_bar"}),
-                Exercise("Impossible Dips", 10, "Advanced ring dips", {"pullup_bar"}),
-            ],
-            
-            "cardio": [
-                Exercise("Marching in Place", 1, "Low impact marching", set()),
-                Exercise("Jumping Jacks", 2, "Basic jumping jacks", set()),
-                Exercise("High Knees", 3, "Running in place", set()),
-                Exercise("Butt Kickers", 4, "Heel to glute kicks", set()),
-                Exercise("Burpees", 5, "Full body exercise", set()),
-                Exercise("Mountain Climbers", 6, "Fast mountain climbers", set()),
-                Exercise("Star Jumps", 7, "Explosive star position", set()),
-                Exercise("Tuck Jumps", 8, "Knees to chest jumps", set()),
-                Exercise("Squat Jumps", 9, "Continuous squat jumps", set()),
-                Exercise("Burpee Box Jumps", 10, "Burpee with box jump", set()),
-                Exercise("Devil Press", 11, "Burpee with dumbbells", {"dumbbells"}),
-                Exercise("Dumbbell Swings", 6, "Kettlebell swing motion with dumbbell", {"dumbbells"}),
-                Exercise("Dumbbell Thrusters", 8, "Squat to overhead press", {"dumbbells"}),
-                Exercise("Treadmill Walk", 2, "Brisk walking", {"treadmill"}),
-                Exercise("Treadmill Jog", 4, "Light jogging", {"treadmill"}),
-                Exercise("Treadmill Run", 6, "Moderate running", {"treadmill"}),
-                Exercise("Treadmill Sprint Intervals", 8, "High intensity intervals", {"treadmill"}),
-                Exercise("Treadmill Hill Walk", 5, "Incline walking", {"treadmill"}),
-                Exercise("Treadmill Hill Run", 9, "Incline running", {"treadmill"}),
-            ],
-            
-            "yoga": [
-                Exercise("Child's Pose", 1, "Restorative kneeling pose", set()),
-                Exercise("Cat-Cow Stretch", 2, "Spinal mobility exercise", set()),
-                Exercise("Downward Dog", 3, "Inverted V stretch", set()),
-                Exercise("Sun Salutation A", 4, "Basic sun salutation sequence", set()),
-                Exercise("Warrior I", 5, "Standing lunge pose", set()),
-                Exercise("Warrior II", 6, "Standing wide-legged pose", set()),
-                Exercise("Triangle Pose", 7, "Standing side stretch", set()),
-                Exercise("Tree Pose", 8, "Standing balance pose", set()),
-                Exercise("Crow Pose", 9, "Arm balance pose", set()),
-                Exercise("Headstand", 10, "Inverted balance pose", set()),
-                Exercise("Handstand", 11, "Advanced inverted pose", set()),
-                Exercise("Scorpion Pose", 12, "Advanced backbend inversion", set()),
-            ],
-            
-            "stretches": [
-                Exercise("Neck Rolls", 1, "Gentle neck mobility", set()),
-                Exercise("Shoulder Rolls", 2, "Shoulder mobility", set()),
-                Exercise("Arm Circles", 3, "Dynamic arm stretches", set()),
-                Exercise("Hip Circles", 4, "Hip mobility exercise", set()),
-                Exercise("Leg Swings", 5, "Dynamic leg stretches", set()),
-                Exercise("Hamstring Stretch", 6, "Seated or standing hamstring stretch", set()),
-                Exercise("Quad Stretch", 7, "Standing quadriceps stretch", set()),
-                Exercise("Calf Stretch", 8, "Wall or standing calf stretch", set()),
-                Exercise("Hip Flexor Stretch", 9, "Lunge position hip flexor stretch", set()),
-                Exercise("Pigeon Pose", 10, "Deep hip opener", set()),
-                Exercise("Butterfly Stretch", 11, "Seated groin stretch", set()),
-                Exercise("Spinal Twist", 12, "Seated or lying spinal rotation", set()),
-            ]
-        }
 
     def get_user_equipment(self) -> Set[str]:
         """Interactive equipment selection"""
@@ -179,16 +228,9 @@ class ExercisePopulator:
         print("Please select your available equipment:")
         print()
         
-        available_equipment = {
-            "pullup_bar": "Pull-up bar (or any hanging bar)",
-            "dumbbells": "Dumbbells (adjustable or fixed weight)",
-            "barbell": "Barbell with weights",
-            "treadmill": "Treadmill or running machine"
-        }
-        
         selected_equipment = set()
         
-        for equipment, description in available_equipment.items():
+        for equipment, description in AVAILABLE_EQUIPMENT.items():
             while True:
                 answer = input(f"Do you have {description}? (y/n): ").lower().strip()
                 if answer in ['y', 'yes']:
@@ -204,40 +246,62 @@ class ExercisePopulator:
         
         return selected_equipment
 
-    def filter_exercises_by_equipment(self, user_equipment: Set[str]) -> Dict[str, List[Exercise]]:
-        """Filter exercises based on available equipment"""
-        filtered_exercises = {}
-        
-        for category, exercises in self.equipment_exercises.items():
-            filtered_exercises[category] = []
+    def _iter_insert_rows(self, user_equipment: Set[str], verbose: bool = False):
+        """Yield insert rows for exercises usable with the given equipment"""
+        missing_mask = ~_pack_equipment(user_equipment)
+        for category, exercises in _EXERCISE_CATALOG.items():
+            count = 0
             
             for exercise in exercises:
-                if not exercise.equipment_required or exercise.equipment_required.issubset(user_equipment):
-                    filtered_exercises[category].append(exercise)
-        
-        return filtered_exercises
+                if not exercise.equipment_mask & missing_mask:
+                    count += 1
+                    yield (
+                        category,
+                        exercise.name,
+                        exercise.difficulty_level,
+                        exercise.max_reps_achieved,
+                        exercise.description,
+                        exercise.equipment_str
+                    )
+            
+            if verbose:
+                print(f"Adding {count} exercises to {category.upper()} category...")
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a database connection tuned for bulk writes"""
+        # Autocommit mode; populate_exercises manages its own transaction
+        conn = sqlite3.connect(self.db_file, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        return conn
 
-    def init_database(self):
+    def init_database(self, conn: sqlite3.Connection):
         """Initialize SQLite database with updated schema"""
-        conn = sqlite3.connect(self.db_file)
         cursor = conn.cursor()
 
-        # Drop existing exercises table to recreate with new schema
-        cursor.execute("DROP TABLE IF EXISTS exercises")
+        # Only recreate the exercises table when it predates the current schema
+        schema_version = cursor.execute("PRAGMA user_version").fetchone()[0]
+        if schema_version < SCHEMA_VERSION:
+            cursor.execute("DROP TABLE IF EXISTS exercises")
 
-        # Create exercises table with equipment field
+        # Create exercises table with equipment field; uniqueness of
+        # (category, name) is enforced by idx_exercises_cat_name below
         cursor.execute("""
-            CREATE TABLE exercises (
+            CREATE TABLE IF NOT EXISTS exercises (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 category TEXT NOT NULL,
                 name TEXT NOT NULL,
                 difficulty_level INTEGER NOT NULL,
                 max_reps_achieved INTEGER DEFAULT 0,
                 description TEXT,
-                equipment_required TEXT,
-                UNIQUE(category, name)
+                equipment_required TEXT
             )
         """)
+        cursor.execute(
+            "CREATE UNIQUE INDEX IF NOT EXISTS idx_exercises_cat_name "
+            "ON exercises(category, name)"
+        )
 
         # Create workout_sessions table
         cursor.execute("""
@@ -259,78 +323,125 @@ class ExercisePopulator:
             )
         """)
 
+        cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
         conn.commit()
-        conn.close()
 
-    def populate_exercises(self, filtered_exercises: Dict[str, List[Exercise]]):
-        """Populate database with filtered exercises"""
-        conn = sqlite3.connect(self.db_file)
+    def populate_exercises(self, conn: sqlite3.Connection, user_equipment: Set[str], verbose: bool = False):
+        """Populate database with exercises available for the user's equipment"""
         cursor = conn.cursor()
 
-        total_exercises = 0
-        
-        for category, exercises in filtered_exercises.items():
-            print(f"Adding {len(exercises)} exercises to {category.upper()} category...")
-            
-            for exercise in exercises:
-                equipment_str = ','.join(sorted(exercise.equipment_required)) if exercise.equipment_required else ''
-                
-                cursor.execute(
-                    """
-                    INSERT OR REPLACE INTO exercises 
-                    (category, name, difficulty_level, max_reps_achieved, description, equipment_required) 
-                    VALUES (?, ?, ?, ?, ?, ?)
-                """,
-                    (
-                        category,
-                        exercise.name,
-                        exercise.difficulty_level,
-                        exercise.max_reps_achieved,
-                        exercise.description,
-                        equipment_str
-                    ),
-                )
-                total_exercises += 1
+        rows = list(self._iter_insert_rows(user_equipment, verbose))
+        wanted = {(category, name) for category, name, *_ in rows}
 
-        conn.commit()
-        conn.close()
-        
-        print(f"\n✅ Successfully added {total_exercises} exercises to the database!")
+        # Write only the delta, in one explicit transaction: drop exercises
+        # for equipment the user no longer has, then upsert the rest
+        cursor.execute("BEGIN")
+        try:
+            stale = [
+                key
+                for key in cursor.execute("SELECT category, name FROM exercises")
+                if key not in wanted
+            ]
+            cursor.executemany(_DELETE_SQL, stale)
+            cursor.executemany(_UPSERT_SQL, rows)
+            cursor.execute("COMMIT")
+        except BaseException:
+            cursor.execute("ROLLBACK")
+            raise
+        # Let SQLite aggregate the summary; MIN(id) keeps catalog order
+        summary = cursor.execute("""
+            SELECT category, COUNT(*), MAX(difficulty_level)
+            FROM exercises
+            GROUP BY category
+            ORDER BY MIN(id)
+        """).fetchall()
+        total_exercises = sum(count for _, count, _ in summary)
         
-        # Show summary
-        print("\nExercise Summary by Category:")
-        for category, exercises in filtered_exercises.items():
-            print(f"  {category.upper()}: {len(exercises)} exercises (Levels 1-{max(e.difficulty_level for e in exercises)})")
+        # Show summary, written out in one go
+        lines = [
+            f"\n✅ Successfully added {total_exercises} exercises to the database!",
+            "\nExercise Summary by Category:",
+        ]
+        lines.extend(
+            f"  {category.upper()}: {count} exercises (Levels 1-{max_level})"
+            for category, count, max_level in summary
+        )
+        print("\n".join(lines))
 
-    def run(self):
+    def run(self, user_equipment: Optional[Set[str]] = None, assume_yes: bool = False, verbose: bool = False):
         """Main execution flow"""
         print("This will reset your exercise database with new progressions.")
-        confirm = input("Continue? (y/n): ").lower().strip()
-        
-        if confirm not in ['y', 'yes']:
-            print("Setup cancelled.")
-            return
+        if not assume_yes:
+            confirm = input("Continue? (y/n): ").lower().strip()
+            
+            if confirm not in ['y', 'yes']:
+                print("Setup cancelled.")
+                return
         
         # Get user equipment
-        user_equipment = self.get_user_equipment()
-        
-        # Filter exercises
-        filtered_exercises = self.filter_exercises_by_equipment(user_equipment)
+        if user_equipment is None:
+            user_equipment = self.get_user_equipment()
         
-        # Initialize database
-        print("Initializing database...")
-        self.init_database()
-        
-        # Populate exercises
-        self.populate_exercises(filtered_exercises)
+        # A fresh install has no workout history to preserve, so build the
+        # database in memory and copy it to disk in one go at the end
+        fresh_install = not self.db_file.exists()
+        conn = sqlite3.connect(":memory:", isolation_level=None) if fresh_install else self._connect()
+        try:
+            # Initialize database
+            print("Initializing database...")
+            self.init_database(conn)
+            
+            # Populate exercises
+            self.populate_exercises(conn, user_equipment, verbose)
+            
+            if fresh_install:
+                disk = sqlite3.connect(self.db_file)
+                try:
+                    conn.backup(disk)
+                    disk.execute("PRAGMA journal_mode=WAL")
+                finally:
+                    disk.close()
+        finally:
+            conn.close()
         
         print("\n🎉 Exercise database setup complete!")
         print("You can now run 'python workout_cli.py workout' to start your personalized workouts.")
 
 
 def main():
+    parser = argparse.ArgumentParser(
+        description="Workout Snacks - Exercise Database Setup"
+    )
+    parser.add_argument(
+        "--equipment",
+        help=f"Comma-separated equipment list, skips the equipment questions "
+        f"(choices: {', '.join(AVAILABLE_EQUIPMENT)}; empty for bodyweight only)",
+    )
+    parser.add_argument(
+        "-y",
+        "--yes",
+        action="store_true",
+        help="Reset the exercise database without asking for confirmation",
+    )
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        action="store_true",
+        help="Report how many exercises are added to each category",
+    )
+
+    args = parser.parse_args()
+
+    user_equipment = None
+    if args.equipment is not None:
+        user_equipment = {e.strip() for e in args.equipment.split(",") if e.strip()}
+        unknown = user_equipment - AVAILABLE_EQUIPMENT.keys()
+        if unknown:
+            parser.error(f"unknown equipment: {', '.join(sorted(unknown))}")
+
     populator = ExercisePopulator()
-    populator.run()
+    populator.run(user_equipment=user_equipment, assume_yes=args.yes, verbose=args.verbose)
 
 
 if __name__ == "__main__":
@@ -4,16 +4,17 @@ Workout Snacks CLI - Command line version without system tray
 """
 
 import argparse
+import atexit
 import random
 import sqlite3
-from collections import Counter
+import sys
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Tuple
 
 
-@dataclass
+@dataclass(slots=True)
 class Exercise:
     name: str
     difficulty_level: int
@@ -22,28 +23,92 @@ class Exercise:
     category: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkoutSession:
     timestamp: datetime
     exercises: List[Tuple[str, int]]  # (exercise_name, reps_completed)
 
 
+# Resolved once per process; the home directory does not change under us
+_DATA_DIR = Path.home() / ".workout-snacks"
+_DB_FILE = _DATA_DIR / "workout_data.db"
+
+_SQL_INSERT_SESSION = """
+    INSERT INTO workout_sessions (timestamp, duration_minutes)
+    VALUES (?, ?)
+"""
+_SQL_INSERT_EXERCISE = """
+    INSERT INTO workout_exercises (session_id, exercise_name, reps_completed)
+    VALUES (?, ?, ?)
+"""
+_SQL_UPDATE_EXERCISE = """
+    UPDATE exercises
+    SET max_reps_achieved = ?
+    WHERE category = ? AND name = ?
+"""
+
+# Current exercise per category, as its position in load_exercises' order:
+# the easiest one below the progression threshold (15 reps), or the
+# hardest once every exercise in the category has reached it
+_SQL_CURRENT_EXERCISES = """
+    SELECT category, position
+    FROM (
+        SELECT
+            category,
+            position,
+            ROW_NUMBER() OVER (
+                PARTITION BY category
+                ORDER BY
+                    max_reps_achieved >= 15,
+                    CASE WHEN max_reps_achieved < 15 THEN position ELSE -position END
+            ) AS pick
+        FROM (
+            SELECT
+                category,
+                max_reps_achieved,
+                ROW_NUMBER() OVER (
+                    PARTITION BY category ORDER BY difficulty_level, name
+                ) - 1 AS position
+            FROM exercises
+        )
+    )
+    WHERE pick = 1
+    ORDER BY category
+"""
+
+
 class WorkoutApp:
     def __init__(self):
-        self.data_dir = Path.home() / ".workout-snacks"
+        self.data_dir = _DATA_DIR
         self.data_dir.mkdir(exist_ok=True)
-        self.db_file = self.data_dir / "workout_data.db"
+        self.db_file = _DB_FILE
+        self.conn = self._connect()
+        atexit.register(self.conn.close)
 
         self.exercises: Dict[str, List[Exercise]] = {}
-        self.workout_history: List[WorkoutSession] = []
+        # category -> difficulty level -> first exercise at that level
+        self._by_level: Dict[str, Dict[int, Exercise]] = {}
+        self._max_level: Dict[str, int] = {}
+        self._current_level_idx: Dict[str, int] = {}
+        self._categories: List[str] = []
+        self._rng = random.Random()
+        self._dirty_exercises: Dict[Tuple[str, str], Exercise] = {}
 
         self.init_database()
-        self.load_data()
+        self.load_exercises()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database connection shared by all methods"""
+        conn = sqlite3.connect(self.db_file)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-64000")
+        return conn
 
     def init_database(self):
         """Initialize SQLite database"""
-        conn = sqlite3.connect(self.db_file)
-        cursor = conn.cursor()
+        cursor = self.conn.cursor()
 
         # Create exercises table with equipment field
         cursor.execute("""
@@ -79,40 +144,42 @@ class WorkoutApp:
             )
         """)
 
-        conn.commit()
-        conn.close()
+        # Index for the session/exercise join (shared with main.py)
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_we_session ON workout_exercises(session_id)"
+        )
 
-    def load_data(self):
-        """Load workout history and exercise progress from database"""
-        conn = sqlite3.connect(self.db_file)
-        cursor = conn.cursor()
+        # Index on the ISO timestamp for the date-range GROUP BY in
+        # get_last_5_days_workout_count
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_ws_timestamp ON workout_sessions(timestamp)"
+        )
+
+        self.conn.commit()
 
-        # Load exercises from database
+    def load_exercises(self):
+        """Load exercise progress from database"""
+        cursor = self.conn.cursor()
+
+        # Load exercises from database; columns follow Exercise's field order
+        # so the row factory builds each one positionally
+        cursor.row_factory = lambda _, row: Exercise(*row)
         try:
             cursor.execute("""
-                SELECT category, name, difficulty_level, max_reps_achieved, description 
+                SELECT name, difficulty_level, max_reps_achieved, COALESCE(description, ''), category
                 FROM exercises 
-                ORDER BY category, difficulty_level
+                ORDER BY category, difficulty_level, name
             """)
 
-            for (
-                category,
-                name,
-                difficulty_level,
-                max_reps,
-                description,
-            ) in cursor.fetchall():
+            for exercise in cursor:
+                category = exercise.category
                 if category not in self.exercises:
                     self.exercises[category] = []
 
-                exercise = Exercise(
-                    name=name,
-                    difficulty_level=difficulty_level,
-                    max_reps_achieved=max_reps,
-                    description=description or "",
-                    category=category,
-                )
                 self.exercises[category].append(exercise)
+                self._by_level.setdefault(category, {}).setdefault(
+                    exercise.difficulty_level, exercise
+                )
 
         except sqlite3.OperationalError:
             print("No exercises found in database.")
@@ -121,77 +188,47 @@ class WorkoutApp:
             )
             return
 
-        # Load workout history
-        cursor.execute("""
-            SELECT ws.timestamp, ws.duration_minutes, we.exercise_name, we.reps_completed
-            FROM workout_sessions ws
-            JOIN workout_exercises we ON ws.id = we.session_id
-            ORDER BY ws.timestamp
-        """)
-
-        sessions_data = {}
-        for timestamp, duration, exercise_name, reps in cursor.fetchall():
-            if timestamp not in sessions_data:
-                sessions_data[timestamp] = {"duration": duration, "exercises": []}
-            sessions_data[timestamp]["exercises"].append((exercise_name, reps))
-
-        for timestamp, data in sessions_data.items():
-            session = WorkoutSession(
-                timestamp=datetime.fromisoformat(timestamp),
-                exercises=data["exercises"],
-            )
-            self.workout_history.append(session)
-
-        conn.close()
-
-    def save_data(self):
-        """Save exercise progress to database"""
-        conn = sqlite3.connect(self.db_file)
-        cursor = conn.cursor()
-
-        # Update exercise progress
-        for category, exercises in self.exercises.items():
-            for exercise in exercises:
-                cursor.execute(
-                    """
-                    UPDATE exercises 
-                    SET max_reps_achieved = ? 
-                    WHERE category = ? AND name = ?
-                """,
-                    (exercise.max_reps_achieved, category, exercise.name),
-                )
-
-        conn.commit()
-        conn.close()
-
-    def save_workout_session(self, session: WorkoutSession):
-        """Save a workout session to database"""
-        conn = sqlite3.connect(self.db_file)
-        cursor = conn.cursor()
-
+        self._max_level = {
+            category: max(levels) for category, levels in self._by_level.items()
+        }
+        self._categories = list(self.exercises)
+        for category in self._categories:
+            self._update_current_level(category)
+
+    def _dirty_progress_rows(self) -> List[Tuple[int, str, str]]:
+        """UPDATE rows for exercises whose progress changed since the last save"""
+        return [
+            (exercise.max_reps_achieved, category, name)
+            for (category, name), exercise in self._dirty_exercises.items()
+        ]
+
+    def _insert_session(self, cursor: sqlite3.Cursor, session: WorkoutSession):
+        """Insert a session and its exercises; the caller owns the transaction"""
         # Insert workout session
-        cursor.execute(
-            """
-            INSERT INTO workout_sessions (timestamp, duration_minutes) 
-            VALUES (?, ?)
-        """,
-            (session.timestamp.isoformat(), 3),
-        )
+        cursor.execute(_SQL_INSERT_SESSION, (session.timestamp.isoformat(), 3))
 
         session_id = cursor.lastrowid
 
         # Insert workout exercises
-        for exercise_name, reps in session.exercises:
-            cursor.execute(
-                """
-                INSERT INTO workout_exercises (session_id, exercise_name, reps_completed) 
-                VALUES (?, ?, ?)
-            """,
-                (session_id, exercise_name, reps),
-            )
+        cursor.executemany(
+            _SQL_INSERT_EXERCISE,
+            [
+                (session_id, exercise_name, reps)
+                for exercise_name, reps in session.exercises
+            ],
+        )
 
-        conn.commit()
-        conn.close()
+    def save_finished_workout(self, session: WorkoutSession):
+        """Save a workout session and the progress it made in one transaction"""
+        cursor = self.conn.cursor()
+        rows = self._dirty_progress_rows()
+
+        with self.conn:
+            self._insert_session(cursor, session)
+            if rows:
+                cursor.executemany(_SQL_UPDATE_EXERCISE, rows)
+
+        self._dirty_exercises.clear()
 
     def get_current_exercises(self) -> List[Exercise]:
         """Get 4 exercises for current workout based on progression"""
@@ -199,97 +236,96 @@ class WorkoutApp:
             print("No exercises available. Run 'python populate_exercises.py' first.")
             return []
 
+        # Find the appropriate exercise per category based on progression
+        current_positions = dict(self.conn.execute(_SQL_CURRENT_EXERCISES))
+
         # Get one exercise from 4 different categories
-        available_categories = list(self.exercises.keys())
-        selected_categories = random.sample(
-            available_categories, min(4, len(available_categories))
+        selected_categories = self._rng.sample(
+            self._categories, min(4, len(self._categories))
         )
 
-        workout_exercises = []
-
-        for category in selected_categories:
-            exercises = self.exercises[category]
-            current_exercise = exercises[0]  # Start with easiest
-
-            # Find the appropriate difficulty level based on progression
-            for exercise in exercises:
-                if exercise.max_reps_achieved == 0:
-                    # Never done this exercise, start here
-                    current_exercise = exercise
-                    break
-                if exercise.max_reps_achieved >= 15:  # Progression threshold
-                    # Look for next level
-                    next_level_exercises = [
-                        e
-                        for e in exercises
-                        if e.difficulty_level == exercise.difficulty_level + 1
-                    ]
-                    if next_level_exercises:
-                        current_exercise = next_level_exercises[0]
-                    else:
-                        current_exercise = exercise  # Stay at current level
-                else:
-                    current_exercise = exercise
-                    break
-
-            workout_exercises.append(current_exercise)
-
-        return workout_exercises
+        return [
+            self.exercises[category][current_positions[category]]
+            for category in selected_categories
+        ]
 
     def get_exercise_progression_info(self, exercise: Exercise, category: str) -> tuple:
         """Get current and previous level exercise info for display"""
-        exercises_in_category = self.exercises[category]
-        previous_exercise = None
-
         # Find previous level exercise
-        for ex in exercises_in_category:
-            if ex.difficulty_level == exercise.difficulty_level - 1:
-                previous_exercise = ex
-                break
+        previous_exercise = self._by_level[category].get(exercise.difficulty_level - 1)
 
         return exercise, previous_exercise
 
     def get_last_workout_time(self) -> str:
         """Get timestamp of last workout session"""
-        if not self.workout_history:
+        # Rightmost entry of idx_ws_timestamp, formatted by SQLite
+        row = self.conn.execute("""
+            SELECT strftime('%Y-%m-%d %H:%M:%S', timestamp)
+            FROM workout_sessions
+            ORDER BY timestamp DESC
+            LIMIT 1
+        """).fetchone()
+        if row is None:
             return "No previous workouts found"
 
-        last_workout = max(self.workout_history, key=lambda x: x.timestamp)
-        return last_workout.timestamp.strftime("%Y-%m-%d %H:%M:%S")
+        return row[0]
 
     def get_current_level_for_category(self, category: str) -> Exercise:
         """Get the current level exercise for a category"""
         if category not in self.exercises:
             return None
 
-        exercises = self.exercises[category]
+        return self.exercises[category][self._current_level_idx[category]]
 
-        # Find the highest level with reps achieved
-        current_exercise = exercises[0]  # Default to first
+    def _update_current_level(self, category: str):
+        """Recompute the cached current level index for a category"""
+        exercises = self.exercises[category]
 
-        for exercise in exercises:
-            if exercise.max_reps_achieved > 0:
-                current_exercise = exercise
-            else:
-                break  # First exercise with no reps is current level
+        # Find the highest level with reps achieved, defaulting to first;
+        # the first exercise with no reps ends the current run
+        current_idx = 0
+        for idx, exercise in enumerate(exercises):
+            if exercise.max_reps_achieved == 0:
+                break
+            current_idx = idx
 
-        return current_exercise
+        self._current_level_idx[category] = current_idx
 
     def get_last_5_days_workout_count(self) -> dict:
         """Get workout count for last 5 days"""
         today = datetime.now().date()
         last_5_days = [(today - timedelta(days=i)) for i in range(5)]
 
-        # Count workouts per day
-        workout_dates = [session.timestamp.date() for session in self.workout_history]
-        date_counts = Counter(workout_dates)
+        daily_counts = {day: 0 for day in last_5_days}
+        # Match rows on the ISO date string instead of parsing each one
+        days_by_iso = {day.isoformat(): day for day in last_5_days}
 
-        daily_counts = {}
-        for day in last_5_days:
-            daily_counts[day] = date_counts.get(day, 0)
+        # Count workouts per day; the ISO timestamp's first 10 chars are the date
+        cursor = self.conn.execute(
+            """
+            SELECT substr(timestamp, 1, 10) AS day, COUNT(*)
+            FROM workout_sessions
+            WHERE timestamp >= ?
+            GROUP BY day
+        """,
+            (last_5_days[-1].isoformat(),),
+        )
+        for day, count in cursor:
+            if day in days_by_iso:
+                daily_counts[days_by_iso[day]] = count
 
         return daily_counts
 
+    def _rep_answers(self):
+        """Yield rep answers, prompting per exercise only when interactive"""
+        if sys.stdin.isatty():
+            while True:
+                yield input("   How many reps did you complete? ")
+
+        # Scripted run: read every answer from stdin in one go
+        yield from sys.stdin.read().split()
+        raise EOFError("Ran out of rep counts on stdin")
+
     def start_workout(self):
         """Start a workout session"""
         exercises = self.get_current_exercises()
@@ -297,12 +333,16 @@ class WorkoutApp:
         if not exercises:
             return
 
-        print("\n" + "=" * 60)
-        print("🏋️  WORKOUT TIME! 🏋️")
-        print("=" * 60)
-        print(f"Last workout: {self.get_last_workout_time()}")
-        print("\nToday's 4 exercises (do as many reps as you can with good form):")
-        print()
+        # Build the whole briefing, then write it out at once
+        lines = []
+        lines.append("\n" + "=" * 60)
+        lines.append("🏋️  WORKOUT TIME! 🏋️")
+        lines.append("=" * 60)
+        lines.append(f"Last workout: {self.get_last_workout_time()}")
+        lines.append(
+            "\nToday's 4 exercises (do as many reps as you can with good form):"
+        )
+        lines.append("")
 
         # Display all 4 exercises upfront
         for i, exercise in enumerate(exercises, 1):
@@ -312,20 +352,22 @@ class WorkoutApp:
             else:
                 previous_ex = None
 
-            print(f"{i}. {exercise.name} (Level {exercise.difficulty_level})")
-            print(f"   Description: {exercise.description}")
-            print(f"   Personal Best: {exercise.max_reps_achieved} reps")
+            lines.append(f"{i}. {exercise.name} (Level {exercise.difficulty_level})")
+            lines.append(f"   Description: {exercise.description}")
+            lines.append(f"   Personal Best: {exercise.max_reps_achieved} reps")
             if previous_ex:
-                print(
+                lines.append(
                     f"   Previous Level: {previous_ex.name} (Level {previous_ex.difficulty_level})"
                 )
-            print()
+            lines.append("")
 
-        print("📸 Take a photo if needed, then do your workout!")
-        print("\nWhen ready, enter your completed reps for each exercise:")
-        print()
+        lines.append("📸 Take a photo if needed, then do your workout!")
+        lines.append("\nWhen ready, enter your completed reps for each exercise:")
+        lines.append("")
+        print("\n".join(lines))
 
         completed_exercises = []
+        answers = self._rep_answers()
 
         for i, exercise in enumerate(exercises, 1):
             print(f"{i}. {exercise.name}:")
@@ -333,7 +375,7 @@ class WorkoutApp:
             # Get user input for reps completed
             while True:
                 try:
-                    reps = int(input("   How many reps did you complete? "))
+                    reps = int(next(answers))
                     if reps >= 0:
                         break
                     print("   Please enter a non-negative number.")
@@ -345,6 +387,8 @@ class WorkoutApp:
             # Update personal best
             if reps > exercise.max_reps_achieved:
                 exercise.max_reps_achieved = reps
+                self._dirty_exercises[(exercise.category, exercise.name)] = exercise
+                self._update_current_level(exercise.category)
                 print(f"   🎉 New personal best! ({reps} reps)")
             elif reps >= 15 and exercise.difficulty_level < 20:  # Check for progression
                 print("   💪 Great job! You're ready to progress to the next level!")
@@ -355,9 +399,7 @@ class WorkoutApp:
         session = WorkoutSession(
             timestamp=datetime.now(), exercises=completed_exercises
         )
-        self.workout_history.append(session)
-        self.save_workout_session(session)
-        self.save_data()
+        self.save_finished_workout(session)
 
         print("Great job! Workout completed. 💪")
         print("=" * 60)
@@ -370,38 +412,44 @@ class WorkoutApp:
             )
             return
 
-        print("\n" + "=" * 50)
-        print("📊 WORKOUT PROGRESS 📊")
-        print("=" * 50)
+        # Build the whole report, then write it out at once
+        lines = []
+        lines.append("\n" + "=" * 50)
+        lines.append("📊 WORKOUT PROGRESS 📊")
+        lines.append("=" * 50)
 
         # Show current level for each exercise lane
-        print("Current Level in Each Exercise Lane:")
-        print()
+        lines.append("Current Level in Each Exercise Lane:")
+        lines.append("")
 
-        for category, exercises in self.exercises.items():
+        for category in self.exercises:
             current_exercise = self.get_current_level_for_category(category)
             if current_exercise:
-                max_level = max(ex.difficulty_level for ex in exercises)
+                max_level = self._max_level[category]
 
-                print(f"{category.upper()}:")
-                print(
+                lines.append(f"{category.upper()}:")
+                lines.append(
                     f"  Current: {current_exercise.name} (Level {current_exercise.difficulty_level}/{max_level})"
                 )
-                print(f"  Best: {current_exercise.max_reps_achieved} reps")
-                print()
+                lines.append(f"  Best: {current_exercise.max_reps_achieved} reps")
+                lines.append("")
 
         # Show last 5 days workout count
-        print("Workouts in Last 5 Days:")
+        lines.append("Workouts in Last 5 Days:")
         daily_counts = self.get_last_5_days_workout_count()
 
         for day, count in daily_counts.items():
             day_name = day.strftime("%a %m-%d")
-            print(f"  {day_name}: {count} workouts")
+            lines.append(f"  {day_name}: {count} workouts")
 
         total_recent = sum(daily_counts.values())
-        print(f"\nTotal last 5 days: {total_recent} workouts")
-        print(f"Total all time: {len(self.workout_history)} workouts")
-        print("=" * 50)
+        lines.append(f"\nTotal last 5 days: {total_recent} workouts")
+        total_workouts = self.conn.execute(
+            "SELECT COUNT(*) FROM workout_sessions"
+        ).fetchone()[0]
+        lines.append(f"Total all time: {total_workouts} workouts")
+        lines.append("=" * 50)
+        print("\n".join(lines))
 
 
 def main():
@@ -431,4 +479,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()